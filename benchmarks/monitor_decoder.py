@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+"""Compare the line-by-line status reader the ``Monitor`` used to rely on with the
+incremental :class:`burpui.misc.backend.utils.burp2.JSONStreamDecoder` on a
+synthetic ``c:<client>:b:<n>:p:*`` reply.
+
+The reply is written to a temporary file and served by ``cat`` through an
+unbuffered pipe, just like the ``burp -a m`` process.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from select import select
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from burpui._compat import to_unicode  # noqa: E402
+from burpui.misc.backend.utils.burp2 import Monitor  # noqa: E402
+
+QUERY = "c:bench:b:1:p:*"
+
+
+def generate(path, size):
+    """Write a reply of roughly ``size`` bytes surrounded by response markers"""
+    with open(path, "w") as out:
+        out.write(json.dumps({"logline": "Server version: 2.4.0"}) + "\n")
+        out.write(json.dumps({"response-start": QUERY}) + "\n")
+        out.write('{"clients":[{"name":"bench","backups":[{"number":1,')
+        out.write('"timestamp":1600000000,"flags":[],"browse":{"directory":"*",')
+        out.write('"entries":[')
+        written = 0
+        idx = 0
+        while written < size:
+            entry = json.dumps(
+                {
+                    "name": f"/srv/data/dir{idx // 1000}/file{idx}.bin",
+                    "type": 0,
+                    "mode": 33188,
+                    "uid": 1000,
+                    "gid": 1000,
+                    "nlink": 1,
+                    "size": idx * 17,
+                    "mtime": 1600000000 + idx,
+                },
+                separators=(",", ":"),
+            )
+            if idx:
+                entry = "," + entry
+            out.write(entry)
+            written += len(entry)
+            idx += 1
+        out.write("]}}]}]}\n")
+        out.write(json.dumps({"response-end": QUERY}) + "\n")
+    return idx
+
+
+def legacy_read(proc, timeout=60):
+    """The reader loop used before the incremental decoder"""
+    tmp = ""
+    cache = {}
+    while True:
+        read, _, _ = select([proc.stdout], [], [], timeout)
+        if proc.stdout not in read:
+            raise TimeoutError("Read operation timed out")
+        tmp += to_unicode(proc.stdout.readline()).rstrip("\n")
+        try:
+            jso = json.loads(tmp)
+        except ValueError:
+            continue
+        if "logline" in jso or "response-start" in jso:
+            tmp = ""
+            continue
+        if "response-end" in jso:
+            return cache["json"], cache["raw"]
+        cache["raw"] = tmp
+        cache["json"] = jso
+        tmp = ""
+
+
+def incremental_read(proc, timeout=60):
+    mon = Monitor(None, None, timeout=timeout, ident="bench")
+    mon.proc = proc
+    mon._server_version = "2.4.0"
+    mon.status_delimiter = True
+    try:
+        return mon._read_proc_stdout(timeout, QUERY)
+    finally:
+        # the process is managed by the benchmark
+        mon.proc = None
+
+
+def run(path, reader):
+    proc = subprocess.Popen(["cat", path], stdout=subprocess.PIPE, bufsize=0)
+    try:
+        t0 = time.perf_counter()
+        jso, _ = reader(proc)
+        elapsed = time.perf_counter() - t0
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    entries = len(jso["clients"][0]["backups"][0]["browse"]["entries"])
+    return elapsed, entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="10,500", help="Comma separated reply sizes in MB"
+    )
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=10,
+        help="Skip the legacy reader above this size in MB (it is very slow)",
+    )
+    args = parser.parse_args()
+
+    for size in (int(x) for x in args.sizes.split(",")):
+        with tempfile.NamedTemporaryFile(suffix=".json") as tmp:
+            count = generate(tmp.name, size * 1024 * 1024)
+            print(f"{size} MB reply, {count} entries")
+            elapsed, entries = run(tmp.name, incremental_read)
+            print(f"  incremental: {elapsed:8.3f}s ({entries} entries)")
+            if size <= args.legacy_max:
+                elapsed, entries = run(tmp.name, legacy_read)
+                print(f"  legacy:      {elapsed:8.3f}s ({entries} entries)")
+            else:
+                print("  legacy:      skipped (see --legacy-max)")
+
+
+if __name__ == "__main__":
+    main()
@@ -82,6 +82,23 @@ class Pool:
         await self.receive_channel.aclose()
 
 
+class Flight:
+    """A status query being processed by a monitor. Identical queries received
+    meanwhile wait for its result instead of using another monitor.
+    """
+
+    def __init__(self):
+        self.done = trio.Event()
+        self.result = None
+        self.error = None
+
+    async def wait(self):
+        await self.done.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
 class MonitorPool:
     logger = logger
 
@@ -121,6 +138,15 @@ class MonitorPool:
 
         self.pool = Pool(self.pool_size)
 
+        # queries currently processed by a monitor
+        self._inflight = {}
+        self.counters = {
+            "requests": 0,
+            "cached": 0,
+            "coalesced": 0,
+            "executed": 0,
+        }
+
     def _ssl_context(self):
         if not self.ssl:
             return None
@@ -167,6 +193,58 @@ class MonitorPool:
         self.logger.info(f"{ident} - Releasing monitor")
         await self.pool.put(mon)
 
+    async def _run_query(self, ident, query):
+        async with self.get_mon(ident) as mon:
+            wrap = partial(
+                mon.status,
+                query,
+                timeout=self.timeout,
+                cache=False,
+                raw=True,
+            )
+            return await trio.to_thread.run_sync(wrap)
+
+    async def status(self, ident, query, cache=True):
+        """Run the given status query on a monitor of the pool.
+
+        When cache is allowed, the results are cached for a few seconds and
+        identical queries received while the first one is still running are
+        coalesced.
+        """
+        self.counters["requests"] += 1
+        if not cache:
+            self.counters["executed"] += 1
+            return await self._run_query(ident, query)
+
+        self._cleanup_cache()
+        # return cached results
+        if query in self._status_cache:
+            self.counters["cached"] += 1
+            return self._status_cache[query]
+
+        flight = self._inflight.get(query)
+        if flight:
+            self.counters["coalesced"] += 1
+            self.logger.info(f"{ident} - Waiting for the same query in progress")
+            return await flight.wait()
+
+        flight = self._inflight[query] = Flight()
+        self.counters["executed"] += 1
+        try:
+            response = await self._run_query(ident, query)
+            self._status_cache[query] = response
+            flight.result = response
+            return response
+        except Exception as exc:
+            flight.error = exc
+            raise
+        except BaseException:
+            flight.error = BUIserverException("Query aborted")
+            raise
+        finally:
+            del self._inflight[query]
+            flight.done.set()
+
     async def handle(self, server_stream: trio.abc.Stream):
         try:
             ident = next(CONNECTION_COUNTER)
@@ -219,28 +297,12 @@ class MonitorPool:
                         await trio.sleep(0.5)
                     for mon in tmp:
                         await self.pool.put(mon)
+                    res["queries"] = dict(self.counters, inflight=len(self._inflight))
                     response = json.dumps(res)
                 else:
-                    query = req["query"]
-                    cache = req.get("cache", True)
-
-                    self._cleanup_cache()
-                    # return cached results
-                    if cache and query in self._status_cache:
-                        response = self._status_cache[query]
-                    else:
-                        async with self.get_mon(ident) as mon:
-                            wrap = partial(
-                                mon.status,
-                                query,
-                                timeout=self.timeout,
-                                cache=False,
-                                raw=True,
-                            )
-                            response = await trio.to_thread.run_sync(wrap)
-
-                        if cache:
-                            self._status_cache[query] = response
+                    response = await self.status(
+                        ident, req["query"], req.get("cache", True)
+                    )
                 self.logger.debug(f"{ident} - Sending: {response}")
                 if response:
                     await server_stream.send_all(b"OK")
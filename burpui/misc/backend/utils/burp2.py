@@ -9,8 +9,10 @@
 """
 import datetime
 import json
+import os
 import re
 import subprocess
+from collections import deque
 from select import select
 
 from ...._compat import to_bytes, to_unicode
@@ -25,6 +27,98 @@ from .constant import (
 )
 
 
+class JSONStreamDecoder(object):
+    """The :class:`burpui.misc.backend.utils.burp2.JSONStreamDecoder` class
+    incrementally splits the output of a ``burp -a m`` process into JSON
+    documents.
+
+    Data is fed in large chunks. Document boundaries are searched only once per
+    byte: with ``j:pretty-print-off`` every document fits on a single line so each
+    document is decoded exactly once. Multi-line (pretty-printed) documents are
+    only decoded once their brackets are balanced. JSON strings cannot span
+    lines so the brackets are counted line by line, outside of the strings.
+    """
+
+    logger = logger
+
+    _strings = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+    def __init__(self):
+        self._buf = bytearray()
+        # offset of the first byte of the pending document
+        self._start = 0
+        # offset of the first byte of the pending line
+        self._line = 0
+        # offset up to which we already looked for line boundaries
+        self._scanned = 0
+        # brackets depth of the pending document
+        self._depth = 0
+
+    def __len__(self):
+        return len(self._buf) - self._start
+
+    def reset(self):
+        """Drop any pending data"""
+        self.__init__()
+
+    def feed(self, data):
+        """Append a chunk of data to the internal buffer"""
+        self._buf += data
+
+    def _line_depth(self, buf, bol, eol):
+        line = buf[bol:eol]
+        if b'"' in line:
+            line = self._strings.sub(b"", line)
+        return (
+            line.count(b"{")
+            + line.count(b"[")
+            - line.count(b"}")
+            - line.count(b"]")
+        )
+
+    def decode(self):
+        """Yield every complete document found in the buffer as a
+        ``(json, text)`` tuple
+        """
+        buf = self._buf
+        while True:
+            eol = buf.find(b"\n", self._scanned)
+            if eol == -1:
+                self._scanned = len(buf)
+                break
+            bol = self._line
+            self._line = self._scanned = eol + 1
+            if bol != self._start:
+                self._depth += self._line_depth(buf, bol, eol)
+                if self._depth > 0:
+                    continue
+            with memoryview(buf) as view:
+                text = str(view[self._start : eol], "utf-8")
+            try:
+                jso = json.loads(text)
+            except ValueError:
+                if bol == self._start:
+                    # first line of a multi-line document
+                    self._depth = self._line_depth(buf, bol, eol)
+                    if self._depth > 0:
+                        continue
+                if text.strip():
+                    self.logger.warning(f"Invalid monitor output: {text!r}")
+                # drop the garbage instead of decoding it again and again
+                self._start = self._scanned
+                self._depth = 0
+                continue
+            self._start = self._scanned
+            self._depth = 0
+            yield jso, text.rstrip("\r")
+        # we only keep the pending document
+        if self._start:
+            del buf[: self._start]
+            self._line -= self._start
+            self._scanned -= self._start
+            self._start = 0
+
+
 class Monitor(object):
     """The :class:`burpui.misc.backend.utils.burp2.Monitor` class provides a ``burp-2``
     Monitor object to interact with the server.
@@ -52,6 +146,9 @@ class Monitor(object):
 
     _ignore_logs = re.compile(r"^Server version: (\d+\.\d+\.\d+).*$")
 
+    # size of the chunks read from the burp process stdout
+    read_size = 1024 * 1024
+
     def __init__(self, burpbin, burpconf, app=None, timeout=5, ident=None):
         """
         :param app: ``Burp-UI`` server instance in order to access logger
@@ -77,6 +174,8 @@ class Monitor(object):
         self.batch_list_supported = False
         self.status_delimiter = False
         self.ident = ident or id(self)
+        self._decoder = JSONStreamDecoder()
+        self._documents = deque()
 
         self._burp_client_ok = False
         version = ""
@@ -190,6 +289,8 @@ class Monitor(object):
             shell=False,
             bufsize=0,
         )
+        self._decoder.reset()
+        self._documents.clear()
         if not self._proc_is_alive():
             details = ""
             if verbose:
@@ -254,52 +355,56 @@ class Monitor(object):
         except ValueError:
             return None
 
+    def _next_document(self, timeout):
+        """reads the burp process stdout until a full document is available"""
+        while not self._documents:
+            if not self.proc:
+                raise OSError("process died while reading its output")
+            read, _, _ = select([self.proc.stdout], [], [], timeout)
+            if self.proc.stdout not in read:
+                raise TimeoutError("Read operation timed out")
+            data = os.read(self.proc.stdout.fileno(), self.read_size)
+            if not data:
+                raise OSError("process died while reading its output")
+            self._decoder.feed(data)
+            self._documents.extend(self._decoder.decode())
+        return self._documents.popleft()
+
     def _read_proc_stdout(self, timeout, watching=None):
         """reads the burp process stdout and returns a document or None"""
         doc = ""
-        tmp = ""
         jso = None
         cache = {}
         if watching:
             watching = watching.rstrip()
         while True:
             try:
-                if not self._proc_is_alive():
-                    raise OSError("process died while reading its output")
-                read, _, _ = select([self.proc.stdout], [], [], timeout)
-                if self.proc.stdout not in read:
-                    raise TimeoutError("Read operation timed out")
-                tmp += to_unicode(self.proc.stdout.readline()).rstrip("\n")
-                jso = self._is_valid_json(tmp)
-                # if the string is a valid json and looks like a logline, we
-                # simply ignore it
-                if jso and self._is_ignored(jso, watching):
-                    tmp = ""
+                jso, tmp = self._next_document(timeout)
+                # if the document looks like a logline, we simply ignore it
+                if self._is_ignored(jso, watching):
                     continue
-                elif jso:
-                    if not self.status_delimiter or (
-                        self.status_delimiter and watching is None
-                    ):
-                        doc = tmp
-                        break
-                    start = jso.get("response-start")
-                    end = jso.get("response-end")
-                    if not start and not end:
-                        cache["raw"] = tmp
-                        cache["json"] = jso
-                    elif start and start != watching:
-                        doc = ""
-                        jso = None
-                        break
-                    elif end and end != watching:
-                        doc = ""
-                        jso = None
-                        break
-                    elif end:
-                        doc = cache.get("raw", "")
-                        jso = cache.get("json")
-                        break
-                    tmp = ""
+                if not self.status_delimiter or (
+                    self.status_delimiter and watching is None
+                ):
+                    doc = tmp
+                    break
+                start = jso.get("response-start")
+                end = jso.get("response-end")
+                if not start and not end:
+                    cache["raw"] = tmp
+                    cache["json"] = jso
+                elif start and start != watching:
+                    doc = ""
+                    jso = None
+                    break
+                elif end and end != watching:
+                    doc = ""
+                    jso = None
+                    break
+                elif end:
+                    doc = cache.get("raw", "")
+                    jso = cache.get("json")
+                    break
             except (TimeoutError, IOError, OSError) as exp:
                 # the os throws an exception if there is no data or timeout
                 self.logger.warning(str(exp))
@@ -0,0 +1,149 @@
+import json
+
+import time
+
+import trio
+import trio.testing
+
+from burpui.engines.monitor import MonitorPool
+from burpui.exceptions import BUIserverException
+from burpui.misc.backend.utils.burp2 import JSONStreamDecoder
+
+
+def _decode(data, chunk=7):
+    decoder = JSONStreamDecoder()
+    ret = []
+    for idx in range(0, len(data), chunk):
+        decoder.feed(data[idx : idx + chunk])
+        ret += list(decoder.decode())
+    return ret, decoder
+
+
+def test_stream_decoder_compact():
+    docs = [
+        {"logline": "Server version: 2.4.0"},
+        {"response-start": "c:"},
+        {"clients": [{"name": "toto{", "labels": ["os: ]Linux"]}]},
+        {"response-end": "c:"},
+    ]
+    data = "".join(json.dumps(x) + "\n" for x in docs).encode("utf-8")
+    ret, decoder = _decode(data)
+    assert [x for x, _ in ret] == docs
+    assert [json.loads(x) for _, x in ret] == docs
+    assert len(decoder) == 0
+
+
+def test_stream_decoder_pretty_and_partial():
+    doc = {"clients": [{"name": "tata", "path": "/tmp/}{"}]}
+    data = (json.dumps(doc, indent=4) + "\n\n" + '{"partial": ').encode("utf-8")
+    ret, decoder = _decode(data, 3)
+    assert [x for x, _ in ret] == [doc]
+    assert len(decoder) == len('{"partial": ')
+    decoder.feed(b"true}\n")
+    assert [x for x, _ in decoder.decode()] == [{"partial": True}]
+
+
+def test_stream_decoder_large_document(monkeypatch):
+    doc = {
+        "clients": [
+            {"name": f"client{idx}", "path": "/tmp/}]{[" * (idx % 3)}
+            for idx in range(20000)
+        ]
+    }
+    data = (json.dumps(doc, indent=4) + "\n" + "garbage}\n").encode("utf-8")
+    calls = []
+    loads = json.loads
+
+    def counting_loads(text):
+        calls.append(len(text))
+        return loads(text)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    ret, decoder = _decode(data, 64 * 1024)
+    assert [x for x, _ in ret] == [doc]
+    assert len(decoder) == 0
+    # each line is decoded at most once
+    assert sum(calls) < 2 * len(data)
+
+
+class FakeMonitor:
+    def __init__(self, ident, delay=0):
+        self.ident = ident
+        self.delay = delay
+        self.alive = True
+        self.exited = False
+        self.exit_delay = 0
+        self.queries = []
+
+    def status(self, query="", **kwargs):
+        self.queries.append(query)
+        time.sleep(self.delay)
+        if query == "error":
+            raise BUIserverException("failure")
+        return f"result of {query}"
+
+    def _proc_is_alive(self):
+        return self.alive
+
+    def _exit(self):
+        time.sleep(self.exit_delay)
+        self.exited = True
+
+
+def monitor_pool(tmp_path, delay=0, **conf):
+    path = tmp_path / "buimonitor.cfg"
+    path.write_text(
+        "[Global]\n" + "".join(f"{key} = {val}\n" for key, val in conf.items())
+    )
+    pool = MonitorPool(str(path))
+    spawned = []
+
+    async def spawn(ident):
+        mon = FakeMonitor(ident, delay)
+        mon.last_used = trio.current_time()
+        spawned.append(mon)
+        return mon
+
+    pool._spawn_monitor = spawn
+    return pool, spawned
+
+
+def test_monitor_pool_single_flight(tmp_path):
+    pool, spawned = monitor_pool(tmp_path, 0.2, pool=3, max_pool=3)
+
+    async def main():
+        results = []
+        errors = []
+
+        async def query(name):
+            try:
+                results.append(await pool.status(name, name))
+            except BUIserverException as exc:
+                errors.append(str(exc))
+
+        async with trio.open_nursery() as nursery:
+            pool._nursery = nursery
+            await pool.fill_pool()
+            async with trio.open_nursery() as queries:
+                for _ in range(5):
+                    queries.start_soon(query, "clients")
+                for _ in range(3):
+                    queries.start_soon(query, "error")
+            # the result is cached but not the error
+            await query("clients")
+            await query("error")
+            nursery.cancel_scope.cancel()
+        return results, errors
+
+    results, errors = trio.run(main)
+    assert results == ["result of clients"] * 6
+    assert errors == ["failure"] * 4
+    calls = sorted(query for mon in spawned for query in mon.queries)
+    assert calls == ["clients", "error", "error"]
+    assert pool.counters == {
+        "requests": 10,
+        "cached": 1,
+        "coalesced": 6,
+        "executed": 3,
+    }
+    assert not pool._inflight